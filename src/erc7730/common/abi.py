@@ -1,98 +1,144 @@
+import re
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import StrEnum, auto
-from typing import Any, cast
+from functools import lru_cache
+from types import MappingProxyType
 
-from eth_typing import ABIFunction
-from eth_utils.abi import abi_to_signature, function_signature_to_4byte_selector
-from lark import Lark, UnexpectedInput
-from lark.visitors import Transformer_InPlaceRecursive
+from eth_hash.auto import keccak
+from lark import Lark, Token, UnexpectedInput
+from lark.visitors import Transformer, v_args
 
 from erc7730.model.abi import ABI, Component, Function, InputOutput
 
-_SIGNATURE_PARSER = parser = Lark(
+_REDUCED_SIGNATURE_PATTERN = re.compile(r"[a-zA-Z$_][a-zA-Z0-9$_]*\([a-zA-Z0-9$_,()\[\]]*\)")
+_REDUCED_SIGNATURE_TOKEN = re.compile(r"[(),]|[^(),]+")
+_REDUCED_SIGNATURE_TYPE = re.compile(r"[a-zA-Z$_][a-zA-Z0-9$_]*(\[\])?")
+
+# allowed successors of each token kind in a reduced signature parameters list ("t" stands for a type)
+_REDUCED_SIGNATURE_TRANSITIONS = {
+    "(": {"(", ")", "t"},
+    ")": {",", ")"},
+    ",": {"(", "t"},
+    "t": {",", ")"},
+}
+
+
+@v_args(inline=True)
+class FunctionTransformer(Transformer[Token, Function]):
+    """
+    Transformer to build function domain model objects from the parsed function AST.
+
+    Models are built with model_construct, skipping validation: the grammar already guarantees their shape.
+    """
+
+    def function(self, name: Token, inputs: list[Component]) -> Function:
+        return Function.model_construct(
+            name=str(name),
+            inputs=[
+                InputOutput.model_construct(name=input.name, type=input.type, components=input.components)  # type: ignore
+                for input in inputs
+            ],
+        )
+
+    def params(self, *params: Component) -> list[Component]:
+        return list(params)
+
+    def named_param(self, type_: Token, name: Token | None = None) -> Component:
+        # spaces are allowed between the type name and array brackets
+        return Component.model_construct(name="_" if name is None else str(name), type=type_.replace(" ", ""))
+
+    def named_tuple(self, components: list[Component], name: Token | None = None) -> Component:
+        return Component.model_construct(name="_" if name is None else str(name), type="tuple", components=components)
+
+
+# the transformer is applied inline by the LALR parser, so no intermediate parse tree is built
+_SIGNATURE_PARSER = Lark(
     grammar=r"""
-            function: identifier "(" params ")"
+            function: IDENTIFIER "(" params ")"
             
             params: (param ("," param)*)?
             ?param: named_param | named_tuple
 
             ?tuple: "(" params ")"
                        
-            named_param: type identifier?
-            named_tuple:  tuple identifier?
+            named_param: TYPE IDENTIFIER?
+            named_tuple:  tuple IDENTIFIER?
 
-            array: "[]"
-            identifier: /[a-zA-Z$_][a-zA-Z0-9$_]*/
-            type: identifier array?
+            IDENTIFIER: /[a-zA-Z$_][a-zA-Z0-9$_]*/
+            TYPE: /[a-zA-Z$_][a-zA-Z0-9$_]*( *\[\])?/
 
             %ignore " "
             """,
     start="function",
+    parser="lalr",
+    maybe_placeholders=False,
+    transformer=FunctionTransformer(),
 )
 
 
-class FunctionTransformer(Transformer_InPlaceRecursive):
-    """Visitor to transform the parsed function AST into function domain model objects."""
-
-    def function(self, ast: Any) -> Function:
-        (name, inputs) = ast
-        return Function(
-            name=name,
-            inputs=[InputOutput(name=input.name, type=input.type, components=input.components) for input in inputs],
-        )
-
-    def params(self, ast: Any) -> list[Component]:
-        return ast
+def compute_signature(abi: Function) -> str:
+    """Compute the signature of a Function."""
+    return f"{abi.name}({_params_signature(abi.inputs)})"
 
-    def named_param(self, ast: Any) -> Component:
-        if len(ast) == 1:
-            return Component(name="_", type=ast[0])
-        (type_, name) = ast
-        return Component(name=name, type=type_)
 
-    def named_tuple(self, ast: Any) -> Component:
-        if len(ast) == 1:
-            return Component(name="_", type="tuple", components=ast[0])
-        (components, name) = ast
-        return Component(name=name, type="tuple", components=components)
+def _params_signature(params: list[InputOutput] | list[Component] | None) -> str:
+    """Compute the signature of a list of parameters, collapsing tuples (same as eth_utils abi_to_signature)."""
+    if not params:
+        return ""
+    return ",".join(_param_signature(param) for param in params)
 
-    def array(self, ast: Any) -> str:
-        return "[]"
 
-    def identifier(self, ast: Any) -> str:
-        (value,) = ast
-        return value
+def _param_signature(param: InputOutput | Component) -> str:
+    if not param.type.startswith("tuple"):
+        return param.type
+    # whatever comes after "tuple" is the array dimensions
+    return f"({_params_signature(param.components)}){param.type[5:]}"  # type: ignore
 
-    def type(self, ast: Any) -> str:
-        if len(ast) == 1:
-            return ast[0]
 
-        (value, array) = ast
-        return value + array
+@lru_cache(maxsize=4096)
+def reduce_signature(signature: str) -> str:
+    """Remove parameter names and spaces from a function signature."""
+    if _is_reduced_signature(signature):
+        return signature
+    return compute_signature(parse_signature(signature))
 
 
-def compute_signature(abi: Function) -> str:
-    """Compute the signature of a Function."""
-    abi_function = cast(ABIFunction, abi.model_dump())
-    return abi_to_signature(abi_function)
+def _is_reduced_signature(signature: str) -> bool:
+    """Check if a function signature is already reduced (no parameter names nor spaces), without parsing it."""
+    if _REDUCED_SIGNATURE_PATTERN.fullmatch(signature) is None:
+        return False
 
+    depth = 0
+    previous: str | None = None
+    for token in _REDUCED_SIGNATURE_TOKEN.findall(signature[signature.index("(") :]):
+        kind = token if token in "()," else "t"
+        if kind == "t" and _REDUCED_SIGNATURE_TYPE.fullmatch(token) is None:
+            return False
+        if previous is None:
+            if kind != "(":
+                return False
+        elif depth == 0 or kind not in _REDUCED_SIGNATURE_TRANSITIONS[previous]:
+            return False
+        depth += {"(": 1, ")": -1}.get(kind, 0)
+        previous = kind
 
-def reduce_signature(signature: str) -> str:
-    """Remove parameter names and spaces from a function signature."""
-    return compute_signature(parse_signature(signature))
+    return depth == 0
 
 
+@lru_cache(maxsize=4096)
 def parse_signature(signature: str) -> Function:
     """Parse a function signature."""
     try:
-        return FunctionTransformer().transform(_SIGNATURE_PARSER.parse(signature))
+        return _SIGNATURE_PARSER.parse(signature)  # type: ignore[return-value]
     except UnexpectedInput as e:
         raise ValueError(f"Invalid signature: {signature}") from e
 
 
+@lru_cache(maxsize=4096)
 def signature_to_selector(signature: str) -> str:
     """Compute the keccak of a signature."""
-    return "0x" + function_signature_to_4byte_selector(signature).hex()
+    return "0x" + keccak(signature.encode())[:4].hex()
 
 
 def function_to_selector(abi: Function) -> str:
@@ -100,21 +146,22 @@ def function_to_selector(abi: Function) -> str:
     return signature_to_selector(compute_signature(abi))
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True)
 class Functions:
-    functions: dict[str, Function]
+    functions: Mapping[str, Function]
     proxy: bool
 
 
+_PROXY_FUNCTION_NAMES = frozenset({"proxyType", "getImplementation", "implementation", "proxy__getImplementation"})
+
+
 def get_functions(abis: list[ABI]) -> Functions:
     """Get the functions from a list of ABIs."""
-    functions = Functions(functions={}, proxy=False)
-    for abi in abis:
-        if abi.type == "function":
-            functions.functions[function_to_selector(abi)] = abi
-            if abi.name in ("proxyType", "getImplementation", "implementation", "proxy__getImplementation"):
-                functions.proxy = True
-    return functions
+    function_abis = [abi for abi in abis if isinstance(abi, Function)]
+    return Functions(
+        functions=MappingProxyType({function_to_selector(abi): abi for abi in function_abis}),
+        proxy=any(abi.name in _PROXY_FUNCTION_NAMES for abi in function_abis),
+    )
 
 
 class ABIDataType(StrEnum):
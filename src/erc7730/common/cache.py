@@ -0,0 +1,62 @@
+"""Bounded in-memory cache, used to memoize results computed from models (which are not hashable)."""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar, final
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+
+@final
+class BoundedCache(Generic[_K, _V]):
+    """
+    Bounded in-memory cache, evicting the oldest entries first once full.
+
+    Cached values are shared between callers, so they must not be mutated.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._values: dict[_K, _V] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: _K) -> _V | None:
+        """
+        Get a cached value.
+
+        :param key: cache key
+        :return: cached value, or None if not cached
+        """
+        return self._values.get(key)
+
+    def put(self, key: _K, value: _V) -> _V:
+        """
+        Cache a value, evicting the oldest entry if the cache is full.
+
+        :param key: cache key
+        :param value: value to cache
+        :return: the cached value
+        """
+        with self._lock:
+            if key not in self._values and len(self._values) >= self._maxsize:
+                del self._values[next(iter(self._values))]
+            self._values[key] = value
+        return value
+
+    def get_or_compute(self, key: _K, compute: Callable[[], _V]) -> _V:
+        """
+        Get a cached value, computing and caching it if not cached yet.
+
+        :param key: cache key
+        :param compute: function computing the value
+        :return: cached or computed value
+        """
+        if (value := self._values.get(key)) is None:
+            value = self.put(key, compute())
+        return value
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        with self._lock:
+            self._values.clear()
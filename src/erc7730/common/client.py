@@ -1,6 +1,8 @@
-import json
 import os
+import threading
 from abc import ABC
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from functools import cache
 from typing import Any, TypeVar, final, override
 
@@ -10,17 +12,30 @@ from httpx._content import IteratorByteStream
 from httpx_file import FileTransport
 from limiter import Limiter
 from pydantic import ConfigDict, TypeAdapter, ValidationError
+from pydantic_core import from_json, to_json
 from pydantic_string_url import FileUrl, HttpUrl
 from xdg_base_dirs import xdg_cache_home
 
+from erc7730.common.cache import BoundedCache
 from erc7730.model.abi import ABI
 from erc7730.model.base import Model
 from erc7730.model.types import Address
 
 ETHERSCAN = "api.etherscan.io"
+ETHERSCAN_CHAINLIST_URL = HttpUrl(f"https://{ETHERSCAN}/v2/chainlist")
+ETHERSCAN_API_URL = HttpUrl(f"https://{ETHERSCAN}/v2/api")
 
 _T = TypeVar("_T")
 
+# maximum number of concurrent requests issued by get_all
+_MAX_CONCURRENT_REQUESTS = 8
+
+_CLIENT: Client | None = None
+_CLIENT_LOCK = threading.Lock()
+_TYPE_ADAPTERS: dict[Any, TypeAdapter[Any]] = {}
+_TYPE_ADAPTERS_LOCK = threading.Lock()
+_RESPONSES_CACHE: BoundedCache[tuple[str, tuple[tuple[str, Any], ...]], bytes] = BoundedCache(maxsize=512)
+
 
 class EtherscanChain(Model):
     """Etherscan supported chain info."""
@@ -38,7 +53,7 @@ def get_supported_chains() -> list[EtherscanChain]:
 
     :return: Etherscan supported chains, with name/chain id/block explorer URL
     """
-    return get(url=HttpUrl(f"https://{ETHERSCAN}/v2/chainlist"), model=list[EtherscanChain])
+    return get(url=ETHERSCAN_CHAINLIST_URL, model=list[EtherscanChain])
 
 
 def get_contract_abis(chain_id: int, contract_address: Address) -> list[ABI]:
@@ -52,7 +67,7 @@ def get_contract_abis(chain_id: int, contract_address: Address) -> list[ABI]:
     """
     try:
         return get(
-            url=HttpUrl(f"https://{ETHERSCAN}/v2/api"),
+            url=ETHERSCAN_API_URL,
             chainid=chain_id,
             module="contract",
             action="getabi",
@@ -76,12 +91,21 @@ def get_contract_explorer_url(chain_id: int, contract_address: Address) -> HttpU
     :return: URL to the contract explorer site
     :raises NotImplementedError: if chain id not supported
     """
-    for chain in get_supported_chains():
-        if chain.chainid == chain_id:
-            return HttpUrl(f"{chain.blockexplorer}/address/{contract_address}#code")
-    raise NotImplementedError(
-        f"Chain ID {chain_id} is not supported, please report this to authors of python-erc7730 library"
-    )
+    if (chain := _get_supported_chains_by_id().get(chain_id)) is None:
+        raise NotImplementedError(
+            f"Chain ID {chain_id} is not supported, please report this to authors of python-erc7730 library"
+        )
+    return HttpUrl(f"{chain.blockexplorer}/address/{contract_address}#code")
+
+
+@cache
+def _get_supported_chains_by_id() -> dict[int, EtherscanChain]:
+    """
+    Get supported chains from Etherscan, indexed by chain id.
+
+    :return: Etherscan supported chains, by EIP-155 chain ID
+    """
+    return {chain.chainid: chain for chain in get_supported_chains()}
 
 
 def get(model: type[_T], url: HttpUrl | FileUrl, **params: Any) -> _T:
@@ -92,20 +116,102 @@ def get(model: type[_T], url: HttpUrl | FileUrl, **params: Any) -> _T:
      - GitHub: adaptation to "raw.githubusercontent.com"
      - Etherscan: rate limiting, API key parameter injection, "result" field unwrapping
 
+    HTTP responses are cached on disk, and their content is also memoized in memory, as the same URLs are usually
+    fetched for many descriptors in a batch. Content is deserialized again on each call, so callers always get their
+    own objects. Local files are cheap to read and may change, so they are always read again.
+
     :param url: URL to get data from
     :param model: Pydantic model to deserialize the data
     :return: deserialized response
     :raises Exception: if URL type is not supported, API key not setup, or unexpected response
     """
-    with _client() as client:
-        response = client.get(url, params=params).raise_for_status().content
+    key = (str(url), tuple(sorted(params.items())))
+    memoize = not url.startswith("file:")
+    if not memoize or (response := _RESPONSES_CACHE.get(key)) is None:
+        response = _client().get(url, params=params).raise_for_status().content
+
     try:
-        return TypeAdapter(model).validate_json(response)
+        result = _type_adapter(model).validate_json(response)
     except ValidationError as e:
         raise Exception(f"Received unexpected response from {url}: {response.decode(errors='replace')}") from e
 
+    # only responses that could be deserialized are memoized
+    if memoize:
+        _RESPONSES_CACHE.put(key, response)
+    return result
+
+
+def get_all(model: type[_T], urls: Sequence[HttpUrl | FileUrl]) -> list[_T | Exception]:
+    """
+    Fetch data from several URLs concurrently and deserialize it.
+
+    Requests are issued from a thread pool sharing the HTTP client, so total latency is bound by the slowest request
+    instead of the sum of all of them. See get() for the URL adaptations applied.
+
+    :param model: Pydantic model to deserialize the data
+    :param urls: URLs to get data from
+    :return: deserialized responses, or exception raised while fetching, in the same order as URLs
+    """
+
+    def get_or_exception(url: HttpUrl | FileUrl) -> _T | Exception:
+        try:
+            return get(model=model, url=url)
+        except Exception as e:
+            return e
+
+    if len(urls) <= 1:
+        return [get_or_exception(url) for url in urls]
+
+    with ThreadPoolExecutor(max_workers=min(len(urls), _MAX_CONCURRENT_REQUESTS)) as executor:
+        return list(executor.map(get_or_exception, urls))
+
+
+def reset_client() -> None:
+    """
+    Discard the shared HTTP client, the in-memory responses cache and the Etherscan supported chains.
+
+    The next request creates a new client, reading Etherscan settings (ETHERSCAN_API_KEY, ETHERSCAN_API_HOST) from
+    environment variables again. Use it after changing these variables, as they are otherwise only read once.
+    """
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is not None:
+            _CLIENT.close()
+            _CLIENT = None
+    _RESPONSES_CACHE.clear()
+    get_supported_chains.cache_clear()
+    _get_supported_chains_by_id.cache_clear()
+
+
+def _type_adapter(model: type[_T]) -> TypeAdapter[_T]:
+    """
+    Get a (cached) pydantic type adapter for a model, as building one is costly.
+
+    :param model: Pydantic model or type
+    :return: type adapter for the model
+    """
+    with _TYPE_ADAPTERS_LOCK:
+        if (adapter := _TYPE_ADAPTERS.get(model)) is None:
+            adapter = _TYPE_ADAPTERS[model] = TypeAdapter(model)
+        return adapter
+
 
 def _client() -> Client:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    The client is reused across calls (and threads) to benefit from connection pooling and keep-alive.
+
+    :return: HTTP client with GitHub and Etherscan specific transports
+    """
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = _create_client()
+        return _CLIENT
+
+
+def _create_client() -> Client:
     """
     Create a new HTTP client with GitHub and Etherscan specific transports.
     :return:
@@ -161,21 +267,27 @@ class EtherscanTransport(DelegateTransport):
     ETHERSCAN_API_HOST = "ETHERSCAN_API_HOST"
     ETHERSCAN_API_KEY = "ETHERSCAN_API_KEY"
 
-    @Limiter(rate=5, capacity=5, consume=1)
+    def __init__(self, delegate: BaseTransport) -> None:
+        super().__init__(delegate)
+        # settings are read once, call reset_client() to apply changes to environment variables
+        self._api_host = os.environ.get(self.ETHERSCAN_API_HOST)
+        self._api_key = os.environ.get(self.ETHERSCAN_API_KEY, os.environ.get(f"SCAN_{self.ETHERSCAN_API_KEY}"))
+
     @override
     def handle_request(self, request: Request) -> Response:
         if request.url.host != ETHERSCAN:
             return super().handle_request(request)
+        return self._handle_etherscan_request(request)
 
+    @Limiter(rate=5, capacity=5, consume=1)
+    def _handle_etherscan_request(self, request: Request) -> Response:
         # substitute base URL if provided
-        if (api_host := os.environ.get(self.ETHERSCAN_API_HOST)) is not None:
+        if (api_host := self._api_host) is not None:
             request.url = request.url.copy_with(host=api_host)
             request.headers.update({"Host": api_host})
 
         # add API key if provided
-        if (api_key := os.environ.get(self.ETHERSCAN_API_KEY)) is not None or (
-            api_key := os.environ.get(f"SCAN_{self.ETHERSCAN_API_KEY}")
-        ) is not None:
+        if (api_key := self._api_key) is not None:
             request.url = request.url.copy_add_param("apikey", api_key)
 
         # read response
@@ -184,10 +296,14 @@ class EtherscanTransport(DelegateTransport):
         response.close()
 
         # unwrap result, sometimes containing JSON directly, sometimes JSON in a string
+        # only keys are worth interning, values (ABI names, types, URLs...) are mostly distinct
         try:
-            if (result := response.json().get("result")) is not None:
-                data = result if isinstance(result, str) else json.dumps(result)
-                return Response(status_code=response.status_code, stream=IteratorByteStream([data.encode()]))
+            if (
+                b'"result"' in response.content
+                and (result := from_json(response.content, cache_strings="keys").get("result")) is not None
+            ):
+                data = result.encode() if isinstance(result, str) else to_json(result)
+                return Response(status_code=response.status_code, stream=IteratorByteStream([data]))
         except Exception:
             pass  # nosec B110 - intentional try/except/pass
 
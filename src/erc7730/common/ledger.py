@@ -1,8 +1,11 @@
 """Ledger specific utilities."""
 
+from functools import cache
 
+
+@cache
 def ledger_network_id(chain_id: int) -> str | None:
-    """Get Ledger specific network id from chain id."""
+    """Get Ledger specific network id from chain id (cached, as the lookup walks a long list of cases)."""
     match chain_id:
         case 1:
             return "ethereum"
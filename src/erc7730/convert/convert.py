@@ -2,13 +2,16 @@ from pathlib import Path
 
 from rich import print
 
-from erc7730.common.output import ConsoleOutputAdder, RaisingOutputAdder
+from erc7730.common.output import ConsoleOutputAdder, OutputAdder, RaisingOutputAdder
 from erc7730.common.pydantic import model_to_json_file
 from erc7730.convert import ERC7730Converter, InputType, OutputType
 
 
 def convert_to_file_and_print_errors(
-    input_descriptor: InputType, output_file: Path, converter: ERC7730Converter[InputType, OutputType]
+    input_descriptor: InputType,
+    output_file: Path,
+    converter: ERC7730Converter[InputType, OutputType],
+    out: OutputAdder | None = None,
 ) -> bool:
     """
     Convert an input descriptor to an output file using a converter, and print any errors encountered.
@@ -16,9 +19,10 @@ def convert_to_file_and_print_errors(
     :param input_descriptor: loaded, valid input descriptor
     :param output_file: output file path (overwritten if already exists)
     :param converter: converter to use
+    :param out: console output adder to use, can be shared across conversions (a new one is created if not provided)
     :return: True if output file was written (if no errors, or only non-fatal errors encountered)
     """
-    if (output_descriptor := convert_and_print_errors(input_descriptor, converter)) is not None:
+    if (output_descriptor := convert_and_print_errors(input_descriptor, converter, out)) is not None:
         if isinstance(output_descriptor, dict):
             for identifier, descriptor in output_descriptor.items():
                 descriptor_file = output_file.with_suffix(f".{identifier}{output_file.suffix}")
@@ -34,16 +38,19 @@ def convert_to_file_and_print_errors(
 
 
 def convert_and_print_errors(
-    input_descriptor: InputType, converter: ERC7730Converter[InputType, OutputType]
+    input_descriptor: InputType,
+    converter: ERC7730Converter[InputType, OutputType],
+    out: OutputAdder | None = None,
 ) -> OutputType | dict[str, OutputType] | None:
     """
     Convert an input descriptor using a converter, print any errors encountered, and return the result model.
 
     :param input_descriptor: loaded, valid input descriptor
     :param converter: converter to use
+    :param out: console output adder to use, can be shared across conversions (a new one is created if not provided)
     :return: output descriptor (if no errors, or only non-fatal errors encountered), None otherwise
     """
-    return _normalize_result(converter.convert(input_descriptor, ConsoleOutputAdder()))
+    return _normalize_result(converter.convert(input_descriptor, ConsoleOutputAdder() if out is None else out))
 
 
 def convert_and_raise_errors(
@@ -1,4 +1,4 @@
-from typing import assert_never, final, override
+from typing import final, override
 
 from eip712.model.input.contract import InputEIP712Contract
 from eip712.model.input.descriptor import InputEIP712DAppDescriptor
@@ -9,11 +9,10 @@ from eip712.model.types import EIP712Format
 from erc7730.common.ledger import ledger_network_id
 from erc7730.common.output import ExceptionsToOutput, OutputAdder
 from erc7730.convert import ERC7730Converter
-from erc7730.model.context import EIP712Schema
 from erc7730.model.display import FieldFormat
 from erc7730.model.paths import Array, ContainerField, ContainerPath, DataPath
-from erc7730.model.paths.path_ops import data_path_concat, to_relative
-from erc7730.model.resolved.context import ResolvedDeployment, ResolvedEIP712Context
+from erc7730.model.paths.path_ops import data_path_concat
+from erc7730.model.resolved.context import ResolvedEIP712Context
 from erc7730.model.resolved.descriptor import ResolvedERC7730Descriptor
 from erc7730.model.resolved.display import (
     ResolvedField,
@@ -21,8 +20,26 @@ from erc7730.model.resolved.display import (
     ResolvedNestedFields,
     ResolvedTokenAmountParameters,
     ResolvedValueConstant,
-    ResolvedValuePath,
 )
+from erc7730.model.types import Address
+
+# legacy EIP-712 format for each field format (tokens in arrays are handled separately)
+_FIELD_FORMATS: dict[FieldFormat | None, EIP712Format | None] = {
+    None: None,
+    FieldFormat.ADDRESS_NAME: EIP712Format.RAW,
+    FieldFormat.RAW: EIP712Format.RAW,
+    FieldFormat.ENUM: EIP712Format.RAW,
+    FieldFormat.UNIT: EIP712Format.RAW,
+    FieldFormat.DURATION: EIP712Format.RAW,
+    FieldFormat.NFT_NAME: EIP712Format.RAW,
+    FieldFormat.CALL_DATA: EIP712Format.RAW,
+    FieldFormat.DATE: EIP712Format.DATETIME,
+    FieldFormat.AMOUNT: EIP712Format.AMOUNT,
+    FieldFormat.TOKEN_AMOUNT: EIP712Format.AMOUNT,
+}
+
+# output mapper fields, by (path, label, asset path, format)
+MapperFieldsCache = dict[tuple[str, str, str | None, EIP712Format | None], InputEIP712MapperField]
 
 
 @final
@@ -31,6 +48,9 @@ class ERC7730toEIP712Converter(ERC7730Converter[ResolvedERC7730Descriptor, Input
     Converts ERC-7730 descriptor to Ledger legacy EIP-712 descriptor.
 
     Generates 1 output InputEIP712DAppDescriptor per chain id, as EIP-712 descriptors are chain-specific.
+
+    Output models are built with model_construct, skipping validation: they are assembled from an already validated
+    resolved descriptor.
     """
 
     @override
@@ -42,87 +62,113 @@ class ERC7730toEIP712Converter(ERC7730Converter[ResolvedERC7730Descriptor, Input
             if not isinstance(context, ResolvedEIP712Context):
                 return out.error("context is not EIP712")
 
-            if (domain := context.eip712.domain) is None or (dapp_name := domain.name) is None:
+            eip712 = context.eip712
+            if (domain := eip712.domain) is None or (dapp_name := domain.name) is None:
                 return out.error("EIP712 domain is not defined")
 
             if (contract_name := descriptor.metadata.owner) is None:
                 return out.error("metadata.owner is not defined")
 
+            # group deployment addresses by supported chain id (1 output descriptor per chain id)
+            networks: dict[int, tuple[str, list[Address]]] = {}
+            for deployment in eip712.deployments:
+                if (chain := networks.get(deployment.chainId)) is not None:
+                    chain[1].append(deployment.address)
+                elif (network := ledger_network_id(deployment.chainId)) is None:
+                    out.error(f"network id {deployment.chainId} not supported")
+                else:
+                    networks[deployment.chainId] = (network, [deployment.address])
+
+            # first schema wins if several share the same primary type
+            schemas = {schema.primaryType: schema.types for schema in reversed(eip712.schemas)}
+
+            # identical output fields (same path, label, etc) are shared across messages
+            fields_cache: MapperFieldsCache = {}
+
             messages: list[InputEIP712Message] = []
             for primary_type, format in descriptor.display.formats.items():
-                schema = self._get_schema(primary_type, context.eip712.schemas, out)
+                schema = self._get_schema(primary_type, schemas, out)
 
                 if schema is None:
                     return out.error(f"EIP-712 schema for {primary_type} is missing")
 
                 label = format.intent if isinstance(format.intent, str) else primary_type
 
-                output_fields = []
-                for input_field in format.fields:
-                    if (out_field := self.convert_field(input_field, None, out)) is None:
-                        return None
-                    output_fields.extend(out_field)
+                if (output_fields := self.convert_fields(format.fields, None, out, fields_cache)) is None:
+                    return None
 
                 messages.append(
-                    InputEIP712Message(schema=schema, mapper=InputEIP712Mapper(label=label, fields=output_fields))
+                    InputEIP712Message.model_construct(
+                        schema_=schema, mapper=InputEIP712Mapper.model_construct(label=label, fields=output_fields)
+                    )
                 )
 
-            descriptors: dict[str, InputEIP712DAppDescriptor] = {}
-            for deployment in context.eip712.deployments:
-                output_descriptor = self._build_network_descriptor(deployment, dapp_name, contract_name, messages, out)
-                if output_descriptor is not None:
-                    descriptors[str(deployment.chainId)] = output_descriptor
+            # deployments at the same address on several chains share the same contract descriptor
+            contracts: dict[str, InputEIP712Contract] = {}
+
+            return {
+                str(chain_id): self._build_network_descriptor(
+                    chain_id, network, addresses, dapp_name, contract_name, messages, contracts
+                )
+                for chain_id, (network, addresses) in networks.items()
+            }
 
-        return descriptors
+        return None
 
     @classmethod
     def _build_network_descriptor(
         cls,
-        deployment: ResolvedDeployment,
+        chain_id: int,
+        network: str,
+        addresses: list[Address],
         dapp_name: str,
         contract_name: str,
         messages: list[InputEIP712Message],
-        out: OutputAdder,
-    ) -> InputEIP712DAppDescriptor | None:
-        if (network := ledger_network_id(deployment.chainId)) is None:
-            return out.error(f"network id {deployment.chainId} not supported")
-
-        return InputEIP712DAppDescriptor(
-            blockchainName=network,
-            chainId=deployment.chainId,
-            name=dapp_name,
-            contracts=[
-                InputEIP712Contract(address=deployment.address.lower(), contractName=contract_name, messages=messages)
-            ],
+        contracts: dict[str, InputEIP712Contract],
+    ) -> InputEIP712DAppDescriptor:
+        # resolved addresses are validated and normalized to lowercase already
+        network_contracts: list[InputEIP712Contract] = []
+        for address in dict.fromkeys(addresses):
+            if (contract := contracts.get(address)) is None:
+                contract = contracts[address] = InputEIP712Contract.model_construct(
+                    address=address, contractName=contract_name, messages=messages
+                )
+            network_contracts.append(contract)
+
+        return InputEIP712DAppDescriptor.model_construct(
+            blockchainName=network, chainId=chain_id, name=dapp_name, contracts=network_contracts
         )
 
     @classmethod
     def _get_schema(
-        cls, primary_type: str, schemas: list[EIP712Schema], out: OutputAdder
+        cls, primary_type: str, schemas: dict[str, dict[str, list[EIP712SchemaField]]], out: OutputAdder
     ) -> dict[str, list[EIP712SchemaField]] | None:
-        for schema in schemas:
-            if schema.primaryType == primary_type:
-                return schema.types
-        return out.error(f"schema for type {primary_type} not found")
+        if (schema := schemas.get(primary_type)) is None:
+            return out.error(f"schema for type {primary_type} not found")
+        return schema
 
     @classmethod
-    def convert_field(
-        cls, field: ResolvedField, prefix: DataPath | None, out: OutputAdder
+    def convert_fields(
+        cls,
+        fields: list[ResolvedField],
+        prefix: DataPath | None,
+        out: OutputAdder,
+        cache: MapperFieldsCache | None = None,
     ) -> list[InputEIP712MapperField] | None:
-        match field:
-            case ResolvedFieldDescription():
-                if (output_field := cls.convert_field_description(field, prefix, out)) is None:
+        output_fields = []
+        # nested fields are flattened depth-first with an explicit stack, children pushed in reverse to keep ordering
+        stack: list[ResolvedField] = list(reversed(fields))
+        while stack:
+            # resolved field classes are never subclassed, so an exact type check is enough (and cheaper)
+            if type(current := stack.pop()) is ResolvedFieldDescription:
+                if (output_field := cls.convert_field_description(current, prefix, out, cache)) is None:
                     return None
-                return [output_field]
-            case ResolvedNestedFields():
-                output_fields = []
-                for in_field in field.fields:
-                    if (output_field := cls.convert_field(in_field, prefix, out)) is None:
-                        return None
-                    output_fields.extend(output_field)
-                return output_fields
-            case _:
-                assert_never(field)
+                output_fields.append(output_field)
+            elif type(current) is ResolvedNestedFields:
+                stack.extend(reversed(current.fields))
+            else:
+                raise TypeError(f"Unexpected field type: {type(current)}")
+        return output_fields
 
     @classmethod
     def convert_field_description(
@@ -130,93 +176,61 @@ class ERC7730toEIP712Converter(ERC7730Converter[ResolvedERC7730Descriptor, Input
         field: ResolvedFieldDescription,
         prefix: DataPath | None,
         out: OutputAdder,
+        cache: MapperFieldsCache | None = None,
     ) -> InputEIP712MapperField | None:
-        field_path: DataPath
         asset_path: DataPath | None = None
-        field_format: EIP712Format | None = None
-        in_array: bool = False
-
-        match field.value:
-            case ResolvedValueConstant():
-                return out.error("Constant values are not supported")
-
-            case ResolvedValuePath(path=path):
-                match path:
-                    case DataPath() as field_path:
-                        field_path = data_path_concat(prefix, field_path)
-
-                        for element in field_path.elements:
-                            match element:
-                                case Array():
-                                    in_array = True
-                                    break
-                                case _:
-                                    pass
-
-                    case ContainerPath() as container_path:
-                        return out.error(f"Path {container_path} is not supported")
-                    case _:
-                        assert_never(field.value)
-            case _:
-                assert_never(field.value)
-
-        match field.format:
-            case None:
-                field_format = None
-            case FieldFormat.ADDRESS_NAME:
-                field_format = EIP712Format.RAW
-            case FieldFormat.RAW:
-                field_format = EIP712Format.RAW
-            case FieldFormat.ENUM:
-                field_format = EIP712Format.RAW
-            case FieldFormat.UNIT:
-                field_format = EIP712Format.RAW
-            case FieldFormat.DURATION:
-                field_format = EIP712Format.RAW
-            case FieldFormat.NFT_NAME:
-                field_format = EIP712Format.RAW
-            case FieldFormat.CALL_DATA:
+
+        value, field_format_in, params = field.value, field.format, field.params
+
+        if isinstance(value, ResolvedValueConstant):
+            return out.error("Constant values are not supported")
+
+        if isinstance(path := value.path, ContainerPath):
+            return out.error(f"Path {path} is not supported")
+
+        field_path = path if prefix is None else data_path_concat(prefix, path)
+        in_array = any(isinstance(element, Array) for element in field_path.elements)
+        field_format = _FIELD_FORMATS[field_format_in]
+
+        if field_format_in == FieldFormat.TOKEN_AMOUNT:
+            if in_array:
+                # EIP-712 does not support token references in arrays, fallback to raw format
                 field_format = EIP712Format.RAW
-            case FieldFormat.DATE:
-                field_format = EIP712Format.DATETIME
-            case FieldFormat.AMOUNT:
-                field_format = EIP712Format.AMOUNT
-            case FieldFormat.TOKEN_AMOUNT:
-                if in_array:
-                    # EIP-712 does not support token references in arrays, fallback to raw format
-                    field_format = EIP712Format.RAW
-                else:
-                    field_format = EIP712Format.AMOUNT
-                    if field.params is not None and isinstance(field.params, ResolvedTokenAmountParameters):
-                        match field.params.token:
-                            case None:
-                                return out.error("Token path or reference must be set")
-
-                            case ResolvedValueConstant():
-                                return out.error("Constant values are not supported")
-
-                            case ResolvedValuePath(path=path):
-                                match path:
-                                    case None:
-                                        pass
-                                    case DataPath() as token_path:
-                                        asset_path = data_path_concat(prefix, token_path)
-                                    case ContainerPath() as container_path if container_path.field == ContainerField.TO:
-                                        # In EIP-712 protocol, format=token with no token path
-                                        #  => refers to verifyingContract
-                                        asset_path = None
-                                    case ContainerPath() as container_path:
-                                        return out.error(f"Path {container_path} is not supported")
-                                    case _:
-                                        assert_never(path)
-                            case _:
-                                assert_never(field.value)
-            case _:
-                assert_never(field.format)
-
-        return InputEIP712MapperField(
-            path=str(to_relative(field_path)),
-            label=field.label,
-            assetPath=None if asset_path is None else str(to_relative(asset_path)),
-            format=field_format,
+            elif isinstance(params, ResolvedTokenAmountParameters):
+                if (token := params.token) is None:
+                    return out.error("Token path or reference must be set")
+
+                if isinstance(token, ResolvedValueConstant):
+                    return out.error("Constant values are not supported")
+
+                if isinstance(token_path := token.path, DataPath):
+                    asset_path = token_path if prefix is None else data_path_concat(prefix, token_path)
+                elif token_path.field != ContainerField.TO:
+                    return out.error(f"Path {token_path} is not supported")
+                # otherwise @.to: in EIP-712 protocol, format=token with no token path refers to verifyingContract
+
+        key = (
+            _to_relative_str(field_path),
+            field.label,
+            None if asset_path is None else _to_relative_str(asset_path),
+            field_format,
+        )
+        if cache is not None and (cached_field := cache.get(key)) is not None:
+            return cached_field
+
+        output_field = InputEIP712MapperField.model_construct(
+            path=key[0], label=key[1], assetPath=key[2], format=key[3]
         )
+        if cache is not None:
+            cache[key] = output_field
+        return output_field
+
+
+def _to_relative_str(path: DataPath) -> str:
+    """
+    Render a data path as a relative path string, without building an intermediate relative path object.
+
+    :param path: data path
+    :return: relative path string (same as str(to_relative(path)))
+    """
+    return ".".join(map(str, path.elements))
@@ -9,12 +9,15 @@ from erc7730.common.output import OutputAdder
 from erc7730.common.properties import get_property
 from erc7730.model.input.descriptor import InputERC7730Descriptor
 from erc7730.model.input.path import ContainerPathStr, DataPathStr
-from erc7730.model.paths import ROOT_DESCRIPTOR_PATH, ArrayElement, ContainerPath, DataPath, DescriptorPath, Field
-from erc7730.model.paths.path_ops import descriptor_path_append, to_absolute
+from erc7730.model.paths import ArrayElement, ContainerPath, DataPath, DescriptorPath, Field
+from erc7730.model.paths.path_ops import to_absolute
 from erc7730.model.types import MixedCaseAddress
 
 _T = TypeVar("_T", covariant=True)
 
+_MIXED_CASE_ADDRESS_ADAPTER = TypeAdapter(MixedCaseAddress)
+_DATA_OR_CONTAINER_PATH_ADAPTER: TypeAdapter[DataPath | ContainerPath] = TypeAdapter(DataPathStr | ContainerPathStr)
+
 
 class ConstantProvider(ABC):
     """
@@ -71,7 +74,7 @@ class ConstantProvider(ABC):
                     if path.absolute:
                         return True
                     try:
-                        TypeAdapter(MixedCaseAddress).validate_strings(str(path))
+                        _MIXED_CASE_ADDRESS_ADAPTER.validate_strings(str(path))
                         out.error(
                             title="Invalid data path",
                             message=f""""{path}" is invalid, it must contain a data path to the address in the """
@@ -99,7 +102,7 @@ class ConstantProvider(ABC):
                 message=f"Constant path defined at {value} must be a path string, got {type(resolved_value).__name__}.",
             )
 
-        match TypeAdapter(DataPathStr | ContainerPathStr).validate_strings(resolved_value):
+        match _DATA_OR_CONTAINER_PATH_ADAPTER.validate_strings(resolved_value):
             case ContainerPath() as path:
                 return path
             case DataPath() as path:
@@ -142,17 +145,22 @@ class DefaultConstantProvider(ConstantProvider):
     @override
     def get(self, path: DescriptorPath, out: OutputAdder) -> Any:
         current_target = self.descriptor
-        parent_path = ROOT_DESCRIPTOR_PATH
-        current_path = ROOT_DESCRIPTOR_PATH
+        elements = path.elements
+
+        # paths used in error messages are only built on error, walking the descriptor does not need them
+        def current_path(depth: int) -> DescriptorPath:
+            return DescriptorPath.model_construct(elements=elements[: depth + 1])
+
+        def parent_path(depth: int) -> DescriptorPath:
+            return DescriptorPath.model_construct(elements=elements[:depth])
 
-        for element in path.elements:
-            current_path = descriptor_path_append(current_path, element)
+        for depth, element in enumerate(elements):
             match element:
                 case Field(identifier=field):
                     if isinstance(current_target, Sequence):
                         return out.error(
                             title="Invalid constant path",
-                            message=f"""Path {current_path} is invalid, {parent_path} is an array.""",
+                            message=f"""Path {current_path(depth)} is invalid, {parent_path(depth)} is an array.""",
                         )
                     else:
                         try:
@@ -160,22 +168,22 @@ class DefaultConstantProvider(ConstantProvider):
                         except (AttributeError, KeyError):
                             return out.error(
                                 title="Invalid constant path",
-                                message=f"""Path {current_path} is invalid, {parent_path} has no "{field}" field.""",
+                                message=f"""Path {current_path(depth)} is invalid, {parent_path(depth)} has no """
+                                f""""{field}" field.""",
                             )
                 case ArrayElement(index=i):
                     if not isinstance(current_target, Sequence):
                         return out.error(
                             title="Invalid constant path",
-                            message=f"Path {current_path} is invalid, {parent_path} is not an array.",
+                            message=f"Path {current_path(depth)} is invalid, {parent_path(depth)} is not an array.",
                         )
                     if i >= len(current_target):
                         return out.error(
                             title="Invalid constant path",
-                            message=f"""Path {current_path} is invalid, index {i} is out of bounds.""",
+                            message=f"""Path {current_path(depth)} is invalid, index {i} is out of bounds.""",
                         )
                     current_target = current_target[i]
                 case _:
                     assert_never(element)
-            parent_path = descriptor_path_append(parent_path, element)
 
         return current_target
@@ -1,4 +1,5 @@
-from typing import assert_never, final, override
+from collections.abc import Iterable
+from typing import Any, TypeVar, assert_never, final, override
 
 from eip712.model.schema import EIP712Type
 from pydantic_string_url import HttpUrl
@@ -60,6 +61,20 @@ from erc7730.model.resolved.display import (
 from erc7730.model.resolved.metadata import ResolvedMetadata
 from erc7730.model.types import Address, Id, Selector
 
+_T = TypeVar("_T")
+
+# field formats that cannot be used without parameters
+_FORMATS_REQUIRING_PARAMETERS = frozenset(
+    {
+        FieldFormat.ADDRESS_NAME,
+        FieldFormat.CALL_DATA,
+        FieldFormat.NFT_NAME,
+        FieldFormat.DATE,
+        FieldFormat.UNIT,
+        FieldFormat.ENUM,
+    }
+)
+
 
 @final
 class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedERC7730Descriptor]):
@@ -109,8 +124,9 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
     def _resolve_metadata(cls, metadata: InputMetadata, out: OutputAdder) -> ResolvedMetadata | None:
         resolved_enums = {}
         if metadata.enums is not None:
+            fetched = cls._fetch_all(EnumDefinition, metadata.enums.values())
             for enum_id, enum in metadata.enums.items():
-                if (resolved_enum := cls._resolve_enum(enum, out)) is not None:
+                if (resolved_enum := cls._resolve_enum(enum, fetched, out)) is not None:
                     resolved_enums[enum_id] = resolved_enum
 
         return ResolvedMetadata(
@@ -121,16 +137,20 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
         )
 
     @classmethod
-    def _resolve_enum(cls, enum: HttpUrl | EnumDefinition, out: OutputAdder) -> dict[str, str] | None:
+    def _resolve_enum(
+        cls,
+        enum: HttpUrl | EnumDefinition,
+        fetched: dict[HttpUrl, EnumDefinition | Exception],
+        out: OutputAdder,
+    ) -> dict[str, str] | None:
         match enum:
             case HttpUrl() as url:
-                try:
-                    return client.get(url=url, model=EnumDefinition)
-                except Exception as e:
+                if isinstance(result := fetched[url], Exception):
                     return out.error(
                         title="Failed to fetch enum definition from URL",
-                        message=f'Failed to fetch enum definition from URL "{url}": {e}',
+                        message=f'Failed to fetch enum definition from URL "{url}": {result}',
                     )
+                return result
             case dict():
                 return enum
             case _:
@@ -235,28 +255,45 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
 
     @classmethod
     def _resolve_schemas(cls, schemas: list[EIP712Schema | HttpUrl], out: OutputAdder) -> list[EIP712Schema] | None:
+        fetched = cls._fetch_all(EIP712Schema, schemas)
         resolved_schemas = []
         for schema in schemas:
-            if (resolved_schema := cls._resolve_schema(schema, out)) is not None:
+            if (resolved_schema := cls._resolve_schema(schema, fetched, out)) is not None:
                 resolved_schemas.append(resolved_schema)
         return resolved_schemas
 
     @classmethod
-    def _resolve_schema(cls, schema: EIP712Schema | HttpUrl, out: OutputAdder) -> EIP712Schema | None:
+    def _resolve_schema(
+        cls,
+        schema: EIP712Schema | HttpUrl,
+        fetched: dict[HttpUrl, EIP712Schema | Exception],
+        out: OutputAdder,
+    ) -> EIP712Schema | None:
         match schema:
             case HttpUrl() as url:
-                try:
-                    return client.get(url=url, model=EIP712Schema)
-                except Exception as e:
+                if isinstance(result := fetched[url], Exception):
                     return out.error(
                         title="Failed to fetch EIP-712 schema from URL",
-                        message=f'Failed to fetch EIP-712 schema from URL "{url}": {e}',
+                        message=f'Failed to fetch EIP-712 schema from URL "{url}": {result}',
                     )
+                return result
             case EIP712Schema():
                 return schema
             case _:
                 assert_never(schema)
 
+    @classmethod
+    def _fetch_all(cls, model: type[_T], values: Iterable[Any]) -> dict[HttpUrl, _T | Exception]:
+        """
+        Concurrently fetch all values referenced by URL.
+
+        :param model: Pydantic model to deserialize fetched data
+        :param values: values, either URLs or inline definitions (ignored)
+        :return: fetched value (or fetch error) by URL
+        """
+        urls = list(dict.fromkeys(value for value in values if isinstance(value, HttpUrl)))
+        return dict(zip(urls, client.get_all(model=model, urls=urls), strict=True))
+
     @classmethod
     def _resolve_display(
         cls,
@@ -292,39 +329,35 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
         constants: ConstantProvider,
         out: OutputAdder,
     ) -> ResolvedFieldDescription | None:
-        match definition.format:
-            case None | FieldFormat.RAW | FieldFormat.AMOUNT | FieldFormat.TOKEN_AMOUNT | FieldFormat.DURATION:
-                pass
-            case (
-                FieldFormat.ADDRESS_NAME
-                | FieldFormat.CALL_DATA
-                | FieldFormat.NFT_NAME
-                | FieldFormat.DATE
-                | FieldFormat.UNIT
-                | FieldFormat.ENUM
-            ):
-                if definition.params is None:
-                    return out.error(
-                        title="Missing parameters",
-                        message=f"""Field format "{definition.format.value}" requires parameters to be defined, """
-                        f"""they are missing for field "{definition.path}".""",
-                    )
-            case _:
-                assert_never(definition.format)
+        if definition.params is None and definition.format in _FORMATS_REQUIRING_PARAMETERS:
+            return out.error(
+                title="Missing parameters",
+                message=f"""Field format "{definition.format.value}" requires parameters to be defined, """
+                f"""they are missing for field "{definition.path}".""",
+            )
 
         params = resolve_field_parameters(prefix, definition.params, enums, constants, out)
 
         if (value := resolve_field_value(prefix, definition, definition.format, constants, out)) is None:
             return None
 
-        return ResolvedFieldDescription.model_validate(
-            {
-                "$id": definition.id,
-                "value": value,
-                "label": constants.resolve(definition.label, out),
-                "format": FieldFormat(definition.format) if definition.format is not None else None,
-                "params": params,
-            }
+        if (label := constants.resolve(definition.label, out)) is None:
+            return None
+
+        # label is the only value not already validated, as it can be a constant of any type
+        if not isinstance(label, str):
+            return out.error(
+                title="Invalid label",
+                message=f"""Label of field "{definition.path}" must be a string, got {type(label).__name__}.""",
+            )
+
+        # all other values are either validated input values, or resolved values built with validation
+        return ResolvedFieldDescription.model_construct(
+            id=definition.id,
+            value=value,
+            label=label,
+            format=FieldFormat(definition.format) if definition.format is not None else None,
+            params=params,
         )
 
     @classmethod
@@ -339,13 +372,13 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
                 if format_id.startswith("0x"):
                     return Selector(format_id)
 
-                if (reduced_signature := reduce_signature(format_id)) is not None:
-                    return Selector(signature_to_selector(reduced_signature))
-
-                return out.error(
-                    title="Invalid selector",
-                    message=f""""{format_id}" is not a valid function signature or selector.""",
-                )
+                try:
+                    return Selector(signature_to_selector(reduce_signature(format_id)))
+                except ValueError:
+                    return out.error(
+                        title="Invalid selector",
+                        message=f""""{format_id}" is not a valid function signature or selector.""",
+                    )
             case ResolvedEIP712Context():
                 return format_id
             case _:
@@ -363,15 +396,14 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
         if (fields := cls._resolve_fields(ROOT_DATA_PATH, format.fields, definitions, enums, constants, out)) is None:
             return None
 
-        return ResolvedFormat.model_validate(
-            {
-                "$id": format.id,
-                "intent": format.intent,
-                "fields": fields,
-                "required": format.required,
-                "excluded": format.excluded,
-                "screens": format.screens,
-            }
+        # input values are already validated and share the resolved types, fields are resolved above
+        return ResolvedFormat.model_construct(
+            id=format.id,
+            intent=format.intent,
+            fields=fields,
+            required=format.required,
+            excluded=format.excluded,
+            screens=format.screens,
         )
 
     @classmethod
@@ -29,6 +29,8 @@ from erc7730.model.types import Id
 
 DEFINITIONS_PATH = DescriptorPath(elements=[Field(identifier="display"), Field(identifier="definitions")])
 
+_INPUT_FIELD_PARAMETERS_ADAPTER: TypeAdapter[InputFieldParameters] = TypeAdapter(InputFieldParameters)
+
 
 def resolve_reference(
     prefix: DataPath,
@@ -57,7 +59,7 @@ def resolve_reference(
     resolved_params: ResolvedFieldParameters | None = None
 
     if params:
-        input_params: InputFieldParameters = TypeAdapter(InputFieldParameters).validate_json(json.dumps(params))
+        input_params: InputFieldParameters = _INPUT_FIELD_PARAMETERS_ADAPTER.validate_json(json.dumps(params))
         if (resolved_params := resolve_field_parameters(prefix, input_params, enums, constants, out)) is None:
             return None
 
@@ -12,6 +12,23 @@ from erc7730.model.paths.path_ops import data_or_container_path_concat
 from erc7730.model.resolved.display import ResolvedValue, ResolvedValueConstant, ResolvedValuePath
 from erc7730.model.types import HexStr, ScalarType
 
+_HEX_STR_ADAPTER = TypeAdapter(HexStr)
+
+# expected encoded value data type, for each field format
+_FIELD_FORMAT_ABI_TYPES: dict[FieldFormat | None, ABIDataType] = {
+    None: ABIDataType.STRING,
+    FieldFormat.RAW: ABIDataType.STRING,
+    FieldFormat.AMOUNT: ABIDataType.UINT,
+    FieldFormat.TOKEN_AMOUNT: ABIDataType.UINT,
+    FieldFormat.DURATION: ABIDataType.UINT,
+    FieldFormat.DATE: ABIDataType.UINT,
+    FieldFormat.UNIT: ABIDataType.UINT,
+    FieldFormat.NFT_NAME: ABIDataType.UINT,
+    FieldFormat.ENUM: ABIDataType.UINT,
+    FieldFormat.ADDRESS_NAME: ABIDataType.ADDRESS,
+    FieldFormat.CALL_DATA: ABIDataType.BYTES,
+}
+
 
 def resolve_field_value(
     prefix: DataPath,
@@ -30,25 +47,7 @@ def resolve_field_value(
     :param out: error handler
     :return: resolved value or None if error
     """
-    match input_field_format:
-        case None | FieldFormat.RAW:
-            abi_type = ABIDataType.STRING
-        case (
-            FieldFormat.AMOUNT
-            | FieldFormat.TOKEN_AMOUNT
-            | FieldFormat.DURATION
-            | FieldFormat.DATE
-            | FieldFormat.UNIT
-            | FieldFormat.NFT_NAME
-            | FieldFormat.ENUM
-        ):
-            abi_type = ABIDataType.UINT
-        case FieldFormat.ADDRESS_NAME:
-            abi_type = ABIDataType.ADDRESS
-        case FieldFormat.CALL_DATA:
-            abi_type = ABIDataType.BYTES
-        case _:
-            assert_never(input_field_format)
+    abi_type = _FIELD_FORMAT_ABI_TYPES[input_field_format]
 
     if (
         value := resolve_path_or_constant_value(
@@ -116,7 +115,7 @@ def resolve_path_or_constant_value(
 def encode_value(value: ScalarType, abi_type: ABIDataType, out: OutputAdder) -> HexStr | None:
     if isinstance(value, str) and value.startswith("0x"):
         try:
-            return TypeAdapter(HexStr).validate_strings(value)
+            return _HEX_STR_ADAPTER.validate_strings(value)
         except ValidationError:
             return out.error(
                 title="Invalid hex string",
@@ -36,6 +36,8 @@ class SchemaLeaf(SchemaNode):
 
 SchemaTree = SchemaStruct | SchemaArray | SchemaLeaf
 
+_ABI_DATA_TYPES = frozenset(ABIDataType)
+
 
 def eip712_schema_to_tree(schema: EIP712Schema) -> SchemaTree:
     """
@@ -93,7 +95,7 @@ def _eip712_field_to_tree(field: EIP712SchemaField, types: dict[EIP712Type, list
             match tp.base:
                 case "tuple" | "struct":
                     return _eip712_struct_type_to_tree(types[field.type], types)
-                case base if base in set(ABIDataType):
+                case base if base in _ABI_DATA_TYPES:
                     type_family = ABIDataType(base)
                 case base_type:
                     if (base_type_fields := types.get(base_type)) is None:
@@ -173,7 +175,7 @@ def _abi_component_to_tree(inp: InputOutput | Component) -> SchemaTree:
             match tp.base:
                 case "tuple" | "struct":
                     return _abi_struct_component_to_tree(inp)
-                case base if base in set(ABIDataType):
+                case base if base in _ABI_DATA_TYPES:
                     type_family = ABIDataType(base)
                 case unknown:
                     raise Exception(f"Unexpected ABI type: {unknown}")
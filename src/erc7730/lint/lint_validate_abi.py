@@ -35,6 +35,7 @@ class ValidateABILinter(ERC7730Linter):
 
         if (deployments := context.contract.deployments) is None:
             return
+        descriptor_abis = get_functions(context.contract.abi)
         for deployment in deployments:
             try:
                 if (abis := client.get_contract_abis(deployment.chainId, deployment.address)) is None:
@@ -48,7 +49,6 @@ class ValidateABILinter(ERC7730Linter):
                 continue
 
             reference_abis = get_functions(abis)
-            descriptor_abis = get_functions(context.contract.abi)
             url = client.get_contract_explorer_url(deployment.chainId, deployment.address)
 
             if reference_abis.proxy:
@@ -1,6 +1,6 @@
 from typing import final, override
 
-from erc7730.common.abi import function_to_selector
+from erc7730.common.abi import get_functions
 from erc7730.common.output import OutputAdder
 from erc7730.lint import ERC7730Linter
 from erc7730.model.paths import DataPath, Field
@@ -103,10 +103,10 @@ class ValidateDisplayFieldsLinter(ERC7730Linter):
     @classmethod
     def _validate_abi_paths(cls, descriptor: ResolvedERC7730Descriptor, out: OutputAdder) -> None:
         if isinstance(descriptor.context, ResolvedContractContext):
-            abi_paths_by_selector: dict[str, set[DataPath]] = {}
-            for abi in descriptor.context.contract.abi:
-                if abi.type == "function":
-                    abi_paths_by_selector[function_to_selector(abi)] = compute_abi_schema_paths(abi)
+            abi_paths_by_selector: dict[str, set[DataPath]] = {
+                selector: compute_abi_schema_paths(abi)
+                for selector, abi in get_functions(descriptor.context.contract.abi).functions.items()
+            }
 
             for selector, fmt in descriptor.display.formats.items():
                 if selector not in abi_paths_by_selector:
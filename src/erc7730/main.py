@@ -213,11 +213,13 @@ def command_convert_erc7730_to_eip712(
     output_eip712_path: Annotated[Path, Argument(help="The output EIP-712 file path")],
 ) -> None:
     input_descriptor = InputERC7730Descriptor.load(input_erc7730_path)
-    resolved_descriptor = ERC7730InputToResolved().convert(input_descriptor, ConsoleOutputAdder())
+    out = ConsoleOutputAdder()
+    resolved_descriptor = ERC7730InputToResolved().convert(input_descriptor, out)
     if resolved_descriptor is None or not convert_to_file_and_print_errors(
         input_descriptor=resolved_descriptor,
         output_file=output_eip712_path,
         converter=ERC7730toEIP712Converter(),
+        out=out,
     ):
         raise Exit(1)
 
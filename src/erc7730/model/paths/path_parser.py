@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 
 from lark import Lark, UnexpectedInput
@@ -43,6 +44,9 @@ PATH_PARSER = Lark(
 )
 
 
+_ARRAY_INDEX_ADAPTER = TypeAdapter(ArrayIndex)
+
+
 class PathTransformer(Transformer_InPlaceRecursive):
     """Visitor to transform the parsed path AST into path domain model objects."""
 
@@ -55,7 +59,7 @@ class PathTransformer(Transformer_InPlaceRecursive):
 
     def array_index(self, ast: Any) -> ArrayIndex:
         (value,) = ast
-        return TypeAdapter(ArrayIndex).validate_strings(value)
+        return _ARRAY_INDEX_ADAPTER.validate_strings(value)
 
     def array_element(self, ast: Any) -> ArrayElement:
         (value,) = ast
@@ -92,10 +96,13 @@ class PathTransformer(Transformer_InPlaceRecursive):
 PATH_TRANSFORMER = PathTransformer()
 
 
+@lru_cache(maxsize=8192)
 def to_path(path: str) -> ContainerPath | DataPath | DescriptorPath:
     """
     Parse a path string into a domain model object.
 
+    Results are cached, as the same paths recur across fields and descriptors: returned objects must not be mutated.
+
     :param path: the path input string
     :return: an union of all possible path types
     :raises ValueError: if the input string is not a valid path
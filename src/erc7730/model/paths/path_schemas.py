@@ -3,6 +3,7 @@ from typing import assert_never
 
 from eip712.model.schema import EIP712SchemaField
 
+from erc7730.common.cache import BoundedCache
 from erc7730.model.abi import Component, Function, InputOutput
 from erc7730.model.context import EIP712Schema
 from erc7730.model.paths import (
@@ -15,7 +16,6 @@ from erc7730.model.paths import (
     DataPathElement,
     Field,
 )
-from erc7730.model.paths.path_ops import data_path_append
 from erc7730.model.resolved.display import (
     ResolvedAddressNameParameters,
     ResolvedCallDataParameters,
@@ -41,78 +41,99 @@ class FormatPaths:
     container_paths: set[ContainerPath]  # References to values in the container
 
 
+_SCHEMA_PATHS_CACHE: BoundedCache[str, frozenset[DataPath]] = BoundedCache(maxsize=256)
+
+
 def compute_eip712_schema_paths(schema: EIP712Schema) -> set[DataPath]:
     """
     Compute the sets of valid schema paths for an EIP-712 schema.
 
+    Results are memoized on the serialized schema, as the same schema is usually analyzed several times.
+
     :param schema: EIP-712 schema
     :return: valid schema paths
     """
+    key = f"eip712:{schema.model_dump_json()}"
+    return set(_SCHEMA_PATHS_CACHE.get_or_compute(key, lambda: frozenset(_compute_eip712_schema_paths(schema))))
+
+
+def compute_abi_schema_paths(abi: Function) -> set[DataPath]:
+    """
+    Compute the sets of valid schema paths for an ABI function.
 
+    Results are memoized on the serialized function, as the same ABI is usually analyzed several times.
+
+    :param abi: Solidity ABI function
+    :return: valid schema paths
+    """
+    key = f"abi:{abi.model_dump_json()}"
+    return set(_SCHEMA_PATHS_CACHE.get_or_compute(key, lambda: frozenset(_compute_abi_schema_paths(abi))))
+
+
+def _compute_eip712_schema_paths(schema: EIP712Schema) -> list[DataPath]:
     if (primary_type := schema.types.get(schema.primaryType)) is None:
         raise ValueError(f"Invalid schema: primaryType {schema.primaryType} not in types")
 
-    paths: set[DataPath] = set()
+    # collected as a list and deduplicated once when cached, rather than hashed on each insertion
+    paths: list[DataPath] = []
+    stack: list[tuple[list[DataPathElement], list[EIP712SchemaField]]] = [([], primary_type)]
 
-    def append_paths(path: DataPath, current_type: list[EIP712SchemaField]) -> None:
+    while stack:
+        elements, current_type = stack.pop()
         for field in current_type:
             if len(field.name) == 0:
                 continue  # skip unnamed parameters
 
-            sub_path = data_path_append(path, Field(identifier=field.name))
+            sub_elements: list[DataPathElement] = [*elements, Field(identifier=field.name)]
 
-            field_base_type = field.type.rstrip("[]")
+            field_type = field.type
+            is_array = field_type[-1:] == "]"
+            field_base_type = field_type[: field_type.index("[")] if is_array else field_type
 
             if field_base_type in {"bytes"}:
-                paths.add(data_path_append(sub_path, Array()))
+                paths.append(_to_schema_path([*sub_elements, Array()]))
 
-            if field_base_type != field.type:
-                sub_path = data_path_append(sub_path, Array())
-                paths.add(sub_path)
+            if is_array:
+                sub_elements.append(Array())
+                paths.append(_to_schema_path(sub_elements))
 
             if (target_type := schema.types.get(field_base_type)) is not None:
-                append_paths(sub_path, target_type)
+                stack.append((sub_elements, target_type))
             else:
-                paths.add(sub_path)
-
-    append_paths(ROOT_DATA_PATH, primary_type)
+                paths.append(_to_schema_path(sub_elements))
 
     return paths
 
 
-def compute_abi_schema_paths(abi: Function) -> set[DataPath]:
-    """
-    Compute the sets of valid schema paths for an ABI function.
-
-    :param abi: Solidity ABI function
-    :return: valid schema paths
-    """
-    paths: set[DataPath] = set()
+def _compute_abi_schema_paths(abi: Function) -> list[DataPath]:
+    paths: list[DataPath] = []
+    stack: list[tuple[list[DataPathElement], list[InputOutput] | list[Component] | None]] = [([], abi.inputs)]
 
-    def append_paths(path: DataPath, params: list[InputOutput] | list[Component] | None) -> None:
+    while stack:
+        elements, params = stack.pop()
         if not params:
-            return None
+            continue
         for param in params:
             if len(param.name) == 0:
                 continue  # skip unnamed parameters
 
-            sub_path = data_path_append(path, Field(identifier=param.name))
+            sub_elements: list[DataPathElement] = [*elements, Field(identifier=param.name)]
 
-            param_base_type = param.type.rstrip("[]")
+            param_type = param.type
+            is_array = param_type[-1:] == "]"
+            param_base_type = param_type[: param_type.index("[")] if is_array else param_type
 
             if param_base_type in {"bytes"}:
-                paths.add(data_path_append(sub_path, Array()))
+                paths.append(_to_schema_path([*sub_elements, Array()]))
 
-            if param_base_type != param.type:
-                sub_path = data_path_append(sub_path, Array())
-                paths.add(sub_path)
+            if is_array:
+                sub_elements.append(Array())
+                paths.append(_to_schema_path(sub_elements))
 
             if param.components:
-                append_paths(sub_path, param.components)  # type: ignore
+                stack.append((sub_elements, param.components))  # type: ignore
             else:
-                paths.add(sub_path)
-
-    append_paths(ROOT_DATA_PATH, abi.inputs)
+                paths.append(_to_schema_path(sub_elements))
 
     return paths
 
@@ -151,7 +172,9 @@ def compute_format_schema_paths(format: ResolvedFormat) -> FormatPaths:
                 case _:
                     assert_never(value)
 
-        def append_paths(field: ResolvedField) -> None:
+        stack: list[ResolvedField] = list(format.fields)
+        while stack:
+            field = stack.pop()
             add_value(field.value)
             match field:
                 case ResolvedFieldDescription():
@@ -175,14 +198,10 @@ def compute_format_schema_paths(format: ResolvedFormat) -> FormatPaths:
                         case _:
                             assert_never(field.params)
                 case ResolvedNestedFields():
-                    for nested_field in field.fields:
-                        append_paths(nested_field)
+                    stack.extend(field.fields)
                 case _:
                     assert_never(field)
 
-        for field in format.fields:
-            append_paths(field)
-
     return FormatPaths(data_paths=data_paths, container_paths=container_paths)
 
 
@@ -208,4 +227,16 @@ def data_path_to_schema_path(path: DataPath) -> DataPath:
             case _:
                 assert_never(element)
 
-    return path.model_copy(update={"elements": [to_schema(e) for e in path.elements if to_schema(e) is not None]})
+    return path.model_copy(
+        update={"elements": [schema_element for e in path.elements if (schema_element := to_schema(e)) is not None]}
+    )
+
+
+def _to_schema_path(elements: list[DataPathElement]) -> DataPath:
+    """
+    Build an absolute schema path from already validated elements, without intermediate path objects.
+
+    :param elements: path elements
+    :return: schema path
+    """
+    return ROOT_DATA_PATH.model_copy(update={"elements": elements})
@@ -2,10 +2,12 @@ import pytest
 
 from erc7730.common.abi import (
     compute_signature,
+    get_functions,
+    parse_signature,
     reduce_signature,
     signature_to_selector,
 )
-from erc7730.model.abi import Component, Function, InputOutput
+from erc7730.model.abi import Component, Event, Function, InputOutput
 
 
 @pytest.mark.parametrize(
@@ -22,6 +24,10 @@ from erc7730.model.abi import Component, Function, InputOutput
             "mintToken(uint256 eventId, uint256 tokenId, address receiver, uint256 expirationTime, bytes signature)",
             "mintToken(uint256,uint256,address,uint256,bytes)",
         ),
+        # array params, space before brackets, names
+        ("transfer(address[] to, uint256 [] amounts)", "transfer(address[],uint256[])"),
+        # array param, space before brackets, no name
+        ("f(uint256 [])", "f(uint256[])"),
         # multiple params, spaces everywhere, names, end with tuple
         (
             "f1( uint256[] _a , address _o , ( uint256 v , uint256 d ) _p )",
@@ -37,6 +43,13 @@ from erc7730.model.abi import Component, Function, InputOutput
             "f3( uint256[] _a , ( uint256 v , ( bytes s , address a ) , uint256 d ) _p , address _o )",
             "f3(uint256[],(uint256,(bytes,address),uint256),address)",
         ),
+        # already reduced, nested tuples
+        (
+            "f4(uint256[],(uint256,(bytes,address),uint256),address)",
+            "f4(uint256[],(uint256,(bytes,address),uint256),address)",
+        ),
+        # no spaces, named tuple
+        ("f5((uint256,address)_p,bytes)", "f5((uint256,address),bytes)"),
     ],
 )
 def test_reduce_signature(signature: str, expected: str) -> None:
@@ -44,6 +57,12 @@ def test_reduce_signature(signature: str, expected: str) -> None:
     assert reduce_signature(signature) == expected
 
 
+@pytest.mark.parametrize("signature", ["f(uint256,)", "f(,)", "f(uint256))", "f(uint256"])
+def test_reduce_signature_invalid(signature: str) -> None:
+    with pytest.raises(ValueError):
+        reduce_signature(signature)
+
+
 def test_compute_signature_no_params() -> None:
     abi = Function(name="transfer", inputs=[])
     expected = "transfer()"
@@ -77,3 +96,36 @@ def test_signature_to_selector() -> None:
     signature = "transfer(address,uint256)"
     expected = "0xa9059cbb"
     assert signature_to_selector(signature) == expected
+
+
+def test_parse_signature_is_cached() -> None:
+    signature = "transfer(address to, uint256 amount)"
+    assert parse_signature(signature) is parse_signature(signature)
+
+
+def test_compute_signature_with_tuple_array_params() -> None:
+    abi = Function(
+        name="foo",
+        inputs=[
+            InputOutput(
+                name="bar",
+                type="tuple[]",
+                components=[Component(name="baz", type="uint256[2]"), Component(name="qux", type="address")],
+            ),
+            InputOutput(name="quux", type="bytes"),
+        ],
+    )
+    expected = "foo((uint256[2],address)[],bytes)"
+    assert compute_signature(abi) == expected
+
+
+def test_get_functions() -> None:
+    transfer = Function(
+        name="transfer", inputs=[InputOutput(name="to", type="address"), InputOutput(name="amount", type="uint256")]
+    )
+    event = Event(name="Transfer", inputs=[InputOutput(name="to", type="address")])
+    result = get_functions([transfer, event])
+    assert result.functions == {"0xa9059cbb": transfer}
+    assert not result.proxy
+    with pytest.raises(TypeError):
+        result.functions["0x00000000"] = transfer
@@ -0,0 +1,26 @@
+from erc7730.common.cache import BoundedCache
+
+
+def test_get_or_compute() -> None:
+    cache: BoundedCache[str, list[int]] = BoundedCache(maxsize=2)
+    value = cache.get_or_compute("a", lambda: [1])
+    assert cache.get_or_compute("a", lambda: [2]) is value
+    assert cache.get("b") is None
+
+
+def test_evicts_oldest_entry() -> None:
+    cache: BoundedCache[str, int] = BoundedCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("a", 3)
+    cache.put("c", 4)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 4
+
+
+def test_clear() -> None:
+    cache: BoundedCache[str, int] = BoundedCache(maxsize=2)
+    cache.put("a", 1)
+    cache.clear()
+    assert cache.get("a") is None
@@ -1,4 +1,7 @@
-from pydantic_string_url import HttpUrl
+from pathlib import Path
+
+import pytest
+from pydantic_string_url import FileUrl, HttpUrl
 
 from erc7730.common import client
 from erc7730.model.abi import ABI
@@ -88,3 +91,64 @@ def test_get_from_github() -> None:
     assert len(result1) > 0
     assert len(result2) > 0
     assert result1 == result2
+
+
+def test_get_all_from_files(tmp_path: Path) -> None:
+    file1, file2 = tmp_path / "abi1.json", tmp_path / "abi2.json"
+    file1.write_text('[{"type": "function", "name": "foo", "inputs": []}]')
+    file2.write_text('[{"type": "function", "name": "bar", "inputs": []}]')
+    urls = [FileUrl(file.as_uri()) for file in (file1, file2, tmp_path / "missing.json")]
+    result = client.get_all(model=list[ABI], urls=urls)
+    assert len(result) == 3
+    abis1, abis2, error = result
+    assert isinstance(abis1, list) and [abi.name for abi in abis1] == ["foo"]
+    assert isinstance(abis2, list) and [abi.name for abi in abis2] == ["bar"]
+    assert isinstance(error, Exception)
+
+
+def test_get_from_http_is_memoized() -> None:
+    url = HttpUrl(
+        "https://raw.githubusercontent.com/LedgerHQ/ledger-asset-dapps/refs/heads/main"
+        "/ethereum/uniswap/abis/0x000000000022d473030f116ddee9f6b43ac78ba3.abi.json"
+    )
+    result1 = client.get(model=list[ABI], url=url)
+    result2 = client.get(model=list[ABI], url=url)
+    assert result1 == result2
+    assert result1 is not result2
+
+
+def test_get_memoized_returns_new_objects() -> None:
+    url = HttpUrl("https://example.net/memoized.abi.json")
+    client._RESPONSES_CACHE.put((str(url), ()), b'[{"type": "function", "name": "foo", "inputs": []}]')
+    result1 = client.get(model=list[ABI], url=url)
+    result1.clear()
+    result2 = client.get(model=list[ABI], url=url)
+    assert [abi.name for abi in result2] == ["foo"]
+    client.reset_client()
+
+
+def test_get_from_file_is_not_memoized(tmp_path: Path) -> None:
+    file = tmp_path / "abi.json"
+    file.write_text('[{"type": "function", "name": "foo", "inputs": []}]')
+    result1 = client.get(model=list[ABI], url=FileUrl(file.as_uri()))
+    file.write_text('[{"type": "function", "name": "bar", "inputs": []}]')
+    result2 = client.get(model=list[ABI], url=FileUrl(file.as_uri()))
+    assert [abi.name for abi in result1] == ["foo"]
+    assert [abi.name for abi in result2] == ["bar"]
+
+
+def test_reset_client() -> None:
+    client_before = client._client()
+    client.reset_client()
+    assert client._client() is not client_before
+
+
+def test_reset_client_clears_supported_chains(monkeypatch: pytest.MonkeyPatch) -> None:
+    client.reset_client()
+    monkeypatch.setattr(client, "get", lambda **_: [])
+    assert client._get_supported_chains_by_id() == {}
+    assert client.get_supported_chains.cache_info().currsize == 1
+    assert client._get_supported_chains_by_id.cache_info().currsize == 1
+    client.reset_client()
+    assert client.get_supported_chains.cache_info().currsize == 0
+    assert client._get_supported_chains_by_id.cache_info().currsize == 0
@@ -3,9 +3,10 @@ from pathlib import Path
 import pytest
 from eip712.model.input.descriptor import InputEIP712DAppDescriptor
 
-from erc7730.common.json import dict_from_json_file
+from erc7730.common.json import dict_from_json_file, dict_to_json_str
+from erc7730.common.output import ListOutputAdder
 from erc7730.common.pydantic import model_to_json_dict
-from erc7730.convert.convert import convert_and_print_errors
+from erc7730.convert.convert import convert_and_print_errors, convert_and_raise_errors
 from erc7730.convert.ledger.eip712.convert_erc7730_to_eip712 import ERC7730toEIP712Converter
 from erc7730.convert.resolved.convert_erc7730_input_to_resolved import ERC7730InputToResolved
 from erc7730.model.input.descriptor import InputERC7730Descriptor
@@ -52,3 +53,54 @@ def test_erc7730_registry_files_by_reference(input_file: Path) -> None:
     output_descriptors = convert_and_print_errors(resolved_erc7730_descriptor, ERC7730toEIP712Converter())
     output_descriptor: InputEIP712DAppDescriptor = single_or_first(output_descriptors)
     assert_dict_equals(dict_from_json_file(reference_path), model_to_json_dict(output_descriptor))
+
+
+def test_deployments_grouped_by_chain_id() -> None:
+    """
+    Test converting ERC-7730 => Ledger legacy EIP-712, with several deployments on the same chain.
+
+    Deployments are grouped in 1 output descriptor per chain id, with 1 contract per distinct address.
+    """
+    address1, address2 = "0x" + "1" * 40, "0x" + "2" * 40
+    input_dict = dict_from_json_file(DATA.parent.parent.parent / "resolved" / "data" / "minimal_eip712_input.json")
+    input_dict["metadata"]["owner"] = "Test Owner"
+    input_dict["context"]["eip712"]["domain"] = {"name": "Test dApp"}
+    input_dict["context"]["eip712"]["deployments"] = [
+        {"chainId": 1, "address": address1},
+        {"chainId": 1, "address": address2},
+        {"chainId": 10, "address": address1},
+        {"chainId": 1, "address": address1},
+    ]
+    input_erc7730_descriptor = InputERC7730Descriptor.model_validate_json(dict_to_json_str(input_dict))
+    resolved_erc7730_descriptor = convert_and_raise_errors(input_erc7730_descriptor, ERC7730InputToResolved())
+    output_descriptors = convert_and_raise_errors(resolved_erc7730_descriptor, ERC7730toEIP712Converter())
+
+    assert isinstance(output_descriptors, dict)
+    assert list(output_descriptors) == ["1", "10"]
+    assert [contract.address for contract in output_descriptors["1"].contracts] == [address1, address2]
+    assert [contract.address for contract in output_descriptors["10"].contracts] == [address1]
+    assert output_descriptors["1"].contracts[0] is output_descriptors["10"].contracts[0]
+
+
+def test_no_supported_chain_id_still_validates_messages() -> None:
+    """
+    Test converting ERC-7730 => Ledger legacy EIP-712, with no deployment on a supported chain.
+
+    No output descriptor is generated, but errors in messages are still reported.
+    """
+    input_dict = dict_from_json_file(DATA.parent.parent.parent / "resolved" / "data" / "minimal_eip712_input.json")
+    input_dict["metadata"]["owner"] = "Test Owner"
+    input_dict["context"]["eip712"]["domain"] = {"name": "Test dApp"}
+    input_dict["context"]["eip712"]["deployments"] = [{"chainId": 999999999, "address": "0x" + "1" * 40}]
+    input_dict["display"]["formats"]["TestPrimaryType"]["fields"].append(
+        {"value": "Hello world", "label": "Constant", "format": "raw"}
+    )
+    input_erc7730_descriptor = InputERC7730Descriptor.model_validate_json(dict_to_json_str(input_dict))
+    resolved_erc7730_descriptor = convert_and_raise_errors(input_erc7730_descriptor, ERC7730InputToResolved())
+    assert isinstance(resolved_erc7730_descriptor, ResolvedERC7730Descriptor)
+
+    out = ListOutputAdder()
+    assert not ERC7730toEIP712Converter().convert(resolved_erc7730_descriptor, out)
+    messages = [output.message for output in out.outputs]
+    assert "network id 999999999 not supported" in messages
+    assert "Constant values are not supported" in messages
@@ -270,6 +270,18 @@ def test_registry_files(input_file: Path) -> None:
             description="using a literal value where a data path is expected, defined in constants section",
             error="It seems you are trying to use a constant address value instead",
         ),
+        TestCase(
+            id="invalid_format_key",
+            label="invalid: format key is not a valid function signature",
+            description="using a malformed function signature as format key",
+            error='"function1(bytes4" is not a valid function signature or selector.',
+        ),
+        TestCase(
+            id="invalid_label_constant",
+            label="invalid: label defined in constants section is not a string",
+            description="using a constant of the wrong type as field label",
+            error='Label of field "param1" must be a string, got int.',
+        ),
         TestCase(
             id="literal_values", label="using literal values", description="using literal values anywhere possible"
         ),
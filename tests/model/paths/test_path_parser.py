@@ -241,3 +241,7 @@ def test_invalid_relative_resolved_data_path() -> None:
         TypeAdapter(ResolvedPath).validate_python(to_path("params.[].[-2].[1:5].amountIn"))
     message = str(e.value)
     assert "A resolved data path must be absolute" in message
+
+
+def test_to_path_is_cached() -> None:
+    assert to_path("#.foo.[1]") is to_path("#.foo.[1]")
@@ -105,3 +105,25 @@ def test_compute_eip712_paths_with_multiple_nested_params() -> None:
         to_path("#.bar.nested.[].deep"),
     }
     assert compute_eip712_schema_paths(schema) == expected
+
+
+def test_compute_eip712_paths_with_fixed_size_struct_array() -> None:
+    schema = EIP712Schema(
+        primaryType="Foo",
+        types={
+            "Foo": [EIP712SchemaField(name="bars", type="Bar[2]")],
+            "Bar": [EIP712SchemaField(name="baz", type="uint256")],
+        },
+    )
+    expected = {
+        to_path("#.bars.[]"),
+        to_path("#.bars.[].baz"),
+    }
+    assert compute_eip712_schema_paths(schema) == expected
+
+
+def test_compute_abi_paths_returns_independent_sets() -> None:
+    abi = Function(inputs=[InputOutput(name="foo", type="uint256")])
+    paths = compute_abi_schema_paths(abi)
+    paths.add(to_path("#.bar"))
+    assert compute_abi_schema_paths(abi) == {to_path("#.foo")}